@@ -6,20 +6,25 @@ This demo shows:
 2. Client sending Interest packets and receiving Data packets
 
 Usage:
+    # Install the package first (editable install): pip install -e .
+
     # Terminal 1: Run server
     python examples/ndn_demo.py server
-    
+
     # Terminal 2: Run client
     python examples/ndn_demo.py client
 """
 import asyncio
 import sys
 import logging
-from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / 'src'))
+# uvloop is a drop-in libuv-backed event loop that roughly doubles
+# asyncio socket throughput; fall back silently when not installed
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 from python_project.ndn.client import NDNClient
 from python_project.ndn.server import NDNServer
@@ -31,19 +36,12 @@ logger = logging.getLogger(__name__)
 
 async def run_server():
     """Run NDN server that responds to Interests."""
-    import os
-    # Try to load config file
-    config = get_config()
-    
-    # Get PIB and TPM paths from config or environment
-    pib_path = config.get_ndn_pib_path() or os.getenv('NDN_PIB_PATH')
-    tpm_path = config.get_ndn_tpm_path() or os.getenv('NDN_TPM_PATH')
-    server = NDNServer(pib_path=pib_path, tpm_path=tpm_path)
-    
-    # Get server configuration
-    server_config = config.get_server_config()
-    routes = server_config.get('routes', [])
-    data = server_config.get('data', {})
+    # Resolve all settings once (accessors already check the environment)
+    resolved = get_config().resolve()
+    server = NDNServer(pib_path=resolved.pib_path, tpm_path=resolved.tpm_path)
+
+    routes = resolved.routes
+    data = resolved.data
     
     # Warn if no routes configured
     if not routes:
@@ -59,10 +57,8 @@ async def run_server():
         logger.warning("No data configured in config file!")
         logger.warning("Please configure 'server.data' in config.yaml")
     else:
-        # Store data
+        # Store data (values are pre-encoded to bytes at config load)
         for name, content in data.items():
-            if isinstance(content, str):
-                content = content.encode()
             server.store_data(name, content)
     
     logger.info("=" * 50)
@@ -83,19 +79,12 @@ async def run_server():
 
 async def run_client():
     """Run NDN client that sends Interests."""
-    import os
-    # Try to load config file
-    config = get_config()
-    
-    # Get PIB and TPM paths from config or environment
-    pib_path = config.get_ndn_pib_path() or os.getenv('NDN_PIB_PATH')
-    tpm_path = config.get_ndn_tpm_path() or os.getenv('NDN_TPM_PATH')
-    client = NDNClient(pib_path=pib_path, tpm_path=tpm_path)
-    
-    # Get client configuration
-    client_config = config.get_client_config()
-    interests = client_config.get('interests', [])
-    interest_lifetime = client_config.get('interest_lifetime', 4000)
+    # Resolve all settings once (accessors already check the environment)
+    resolved = get_config().resolve()
+    client = NDNClient(pib_path=resolved.pib_path, tpm_path=resolved.tpm_path)
+
+    interests = resolved.interests
+    interest_lifetime = resolved.interest_lifetime
     
     # Warn if no interests configured
     if not interests:
@@ -119,16 +108,17 @@ async def run_client():
         logger.info(f"Sending {len(interests)} Interest packets: {interests}")
         logger.info("=" * 50)
         
-        # Send Interests from configuration
-        for interest_name in interests:
-            content = await client.express_interest(
-                interest_name,
-                lifetime=interest_lifetime
-            )
+        # Send Interests from configuration concurrently - Interests are
+        # independent, so issuing them together pipelines the RTTs over
+        # the same face. gather preserves result order.
+        results = await asyncio.gather(
+            *(client.express_interest(name, lifetime=interest_lifetime)
+              for name in interests)
+        )
+        for interest_name, content in zip(interests, results):
             if content:
-                logger.info(f"Received content: {content.decode()}")
-            await asyncio.sleep(1)
-        
+                logger.info(f"Received content for {interest_name}: {bytes(content).decode()}")
+
         logger.info("Demo completed")
         client.shutdown()
     
@@ -3,10 +3,26 @@ NDN/gRPC Conversion Project
 
 A project for converting between NDN Interest/Data packets and gRPC messages.
 """
+import importlib
 
 __version__ = "0.1.0"
 
-from .ndn import NDNClient, NDNServer
-from .grpc import NDNGRPCConverter
-
 __all__ = ["NDNClient", "NDNServer", "NDNGRPCConverter", "__version__"]
+
+# Re-exports resolved lazily (PEP 562): importing the gRPC side alone
+# (e.g. the plain echo server) no longer drags in python-ndn's
+# NDNApp/Keychain stack, which dominates the package's import time.
+_LAZY_EXPORTS = {
+    "NDNClient": ".ndn",
+    "NDNServer": ".ndn",
+    "NDNGRPCConverter": ".grpc",
+}
+
+
+def __getattr__(name):
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(target, __name__), name)
+    globals()[name] = value
+    return value
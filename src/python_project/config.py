@@ -9,11 +9,48 @@ Supports loading configuration from:
 import os
 import yaml
 import logging
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 logger = logging.getLogger(__name__)
 
+# Sentinel distinguishing "not configured" from an explicit None
+_MISSING = object()
+
+# Prefer the libyaml C loader; 10-30x faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed config files cached by (path, mtime) so repeated get_config()
+# calls from demos and tests do zero I/O
+_yaml_cache: Dict[Any, Dict[str, Any]] = {}
+
+# Config-file search results cached per (cwd, home); each probe is a
+# stat() syscall, so re-creating Config skips up to four of them
+_search_cache: Dict[Any, Optional[Path]] = {}
+
+
+@dataclass(frozen=True)
+class ResolvedConfig:
+    """
+    Immutable snapshot of all commonly used settings, resolved once.
+
+    Callers read attributes instead of repeating accessor calls (each of
+    which re-checks environment variables) in constructors and loops.
+    """
+    pib_path: Optional[str]
+    tpm_path: Optional[str]
+    log_level: str
+    mode: Optional[str]
+    routes: List[str]
+    data: Dict[str, Any]
+    interests: List[str]
+    interest_lifetime: int
+    grpc_address: str
+
 
 class Config:
     """Configuration manager for the project."""
@@ -31,6 +68,9 @@ class Config:
         """
         self.config_path = config_path
         self._config: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
+        self._resolved: Dict[str, Any] = {}
+        self._snapshot: Optional[ResolvedConfig] = None
         self._load_config()
     
     def _load_config(self):
@@ -46,17 +86,30 @@ class Config:
                 Path(__file__).parent.parent.parent / 'config.yml',
                 Path.home() / '.ndn' / 'config.yaml',
             ]
-            
-            config_file = None
-            for path in possible_paths:
-                if path.exists():
-                    config_file = path
-                    break
+
+            search_key = (str(possible_paths[0].parent), str(Path.home()))
+            if search_key in _search_cache:
+                config_file = _search_cache[search_key]
+            else:
+                config_file = None
+                for path in possible_paths:
+                    # os.path.isfile avoids the stat-result wrapper that
+                    # Path.exists constructs
+                    if os.path.isfile(path):
+                        config_file = path
+                        break
+                _search_cache[search_key] = config_file
         
         if config_file and config_file.exists():
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    self._config = yaml.safe_load(f) or {}
+                cache_key = (str(config_file), config_file.stat().st_mtime_ns)
+                cached = _yaml_cache.get(cache_key)
+                if cached is not None:
+                    self._config = cached
+                else:
+                    with open(config_file, 'r', encoding='utf-8') as f:
+                        self._config = yaml.load(f, Loader=_YamlLoader) or {}
+                    _yaml_cache[cache_key] = self._config
                 logger.info(f"Loaded configuration from: {config_file}")
                 logger.debug(f"Config content: {self._config}")
             except Exception as e:
@@ -68,7 +121,30 @@ class Config:
             else:
                 logger.debug("No configuration file found, using defaults and environment variables")
                 logger.debug(f"Searched paths: {possible_paths}")
-    
+
+        # Pre-encode server data values to bytes once at load time so the
+        # start path can store them without per-entry isinstance checks
+        data = self._config.get('server', {}).get('data', {})
+        if isinstance(data, dict):
+            for name, content in data.items():
+                if isinstance(content, str):
+                    data[name] = content.encode('utf-8')
+
+        # Flatten the nested config once so get() is a single dict lookup
+        # instead of a dotted-path walk per call
+        self._flat = {}
+        self._flatten(self._config, '')
+        self._resolved = {}
+        self._snapshot = None
+
+    def _flatten(self, node: Dict[str, Any], prefix: str):
+        """Flatten nested config dicts into dotted-path keys."""
+        for k, v in node.items():
+            key = f"{prefix}{k}"
+            self._flat[key] = v
+            if isinstance(v, dict):
+                self._flatten(v, f"{key}.")
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get configuration value.
@@ -85,29 +161,25 @@ class Config:
         Returns:
             Configuration value
         """
-        # First check environment variable
-        env_key = key.upper().replace('.', '_')
-        env_value = os.getenv(env_key)
-        if env_value is not None:
-            return env_value
-        
-        # Then check config file
-        keys = key.split('.')
-        value = self._config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    break
+        # Resolved values are memoized; the cache is reset when the config
+        # file is (re)loaded
+        value = self._resolved.get(key, _MISSING)
+        if value is _MISSING:
+            # First check environment variable
+            env_key = key.upper().replace('.', '_')
+            env_value = os.getenv(env_key)
+            if env_value is not None:
+                value = env_value
             else:
-                value = None
-                break
-        
-        if value is not None:
-            return value
-        
-        # Return default
-        return default
+                # Then check the flattened config file
+                value = self._flat.get(key, _MISSING)
+            if value is not _MISSING:
+                self._resolved[key] = value
+
+        if value is _MISSING or value is None:
+            # Return default
+            return default
+        return value
     
     def get_ndn_pib_path(self) -> Optional[str]:
         """Get NDN PIB path from config or environment."""
@@ -133,6 +205,37 @@ class Config:
         """Get client-specific configuration."""
         return self._config.get('client', {})
 
+    def get_client_disable_cache(self) -> bool:
+        """Whether response caching/coalescing is disabled for the client."""
+        return bool(self.get('client.disable_cache', False))
+
+    def get_client_hedge_interests(self) -> bool:
+        """Whether to hedge requests across all configured interests."""
+        return bool(self.get('client.hedge_interests', False))
+
+    def resolve(self) -> ResolvedConfig:
+        """
+        Resolve the commonly used settings into a frozen snapshot.
+
+        Returns:
+            ResolvedConfig with all values resolved once
+        """
+        if getattr(self, '_snapshot', None) is None:
+            server_config = self.get_server_config()
+            client_config = self.get_client_config()
+            self._snapshot = ResolvedConfig(
+                pib_path=self.get_ndn_pib_path(),
+                tpm_path=self.get_ndn_tpm_path(),
+                log_level=self.get_log_level(),
+                mode=self.get_mode(),
+                routes=server_config.get('routes', []),
+                data=server_config.get('data', {}),
+                interests=client_config.get('interests', []),
+                interest_lifetime=client_config.get('interest_lifetime', 4000),
+                grpc_address=client_config.get('grpc_address', 'localhost:50051'),
+            )
+        return self._snapshot
+
 
 # Global config instance
 _config_instance: Optional[Config] = None
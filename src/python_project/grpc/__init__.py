@@ -3,6 +3,18 @@ gRPC conversion framework for NDN Interest/Data packets.
 """
 
 from .converter import NDNGRPCConverter
+from .client import SimpleClient, AsyncSimpleClient, ChannelPool
+from .server import (SimpleService, create_server, run_server,
+                     run_bridge_server)
 
-__all__ = ['NDNGRPCConverter']
+__all__ = [
+    'NDNGRPCConverter',
+    'SimpleClient',
+    'AsyncSimpleClient',
+    'ChannelPool',
+    'SimpleService',
+    'create_server',
+    'run_server',
+    'run_bridge_server',
+]
 
@@ -0,0 +1,82 @@
+"""
+Entry point for the gRPC side of the project.
+
+Usage:
+    python -m python_project.grpc client
+"""
+import argparse
+import logging
+import sys
+
+from .client import SimpleClient
+from .server import run_server
+from ..config import get_config
+from ..utils import setup_logging
+
+logger = logging.getLogger(__name__)
+
+
+def run_client():
+    """Run gRPC client that sends a batch of Data messages."""
+    config = get_config()
+    client_config = config.get_client_config()
+    address = client_config.get('grpc_address', 'localhost:50051')
+    count = int(client_config.get('grpc_data_count', 10))
+
+    client = SimpleClient(address=address)
+    client.connect()
+
+    data_list = [(i, f"payload-{i}".encode()) for i in range(count)]
+
+    logger.info("Sending %s Data messages to %s", len(data_list), address)
+
+    # Issue all calls as futures first, then collect: the calls pipeline
+    # over the multiplexed connections instead of costing one RTT each.
+    futures = [client.process_data_async(value, payload)
+               for value, payload in data_list]
+    for future in futures:
+        response = future.result()
+        logger.info("Received Data: value=%s, payload length=%s bytes",
+                    response.value, len(response.payload))
+
+    logger.info("Client completed")
+    client.disconnect()
+
+
+def main():
+    """Main entry point for the gRPC demo."""
+    parser = argparse.ArgumentParser(
+        prog='python -m python_project.grpc',
+        description='gRPC demo for the Data processing service'
+    )
+    parser.add_argument('mode', choices=['server', 'client'], nargs='?',
+                        help='Running mode')
+    args = parser.parse_args()
+
+    setup_logging("INFO")
+
+    if args.mode == 'server':
+        try:
+            # gRPC accepts 'unix:/path.sock' addresses as-is; for a
+            # gateway colocated with its clients a Unix domain socket
+            # skips the TCP/IP stack and its per-RPC syscall overhead
+            address = get_config().get('server.grpc_listen', '[::]:50051')
+            run_server(address)
+        except KeyboardInterrupt:
+            logger.info("Server stopped by user")
+        except Exception as e:
+            logger.error(f"Error: {e}", exc_info=True)
+    elif args.mode == 'client':
+        try:
+            run_client()
+        except KeyboardInterrupt:
+            logger.info("Client stopped by user")
+        except Exception as e:
+            logger.error(f"Error: {e}", exc_info=True)
+    else:
+        logger.info("Usage: python -m python_project.grpc [server|client]")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: python_project/grpc/bidirectional.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'python_project/grpc/bidirectional.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\'python_project/grpc/bidirectional.proto\x12\rbidirectional\"&\n\x04\x44\x61ta\x12\r\n\x05value\x18\x01 \x01(\x05\x12\x0f\n\x07payload\x18\x02 \x01(\x0c\"/\n\tDataBatch\x12\"\n\x05items\x18\x01 \x03(\x0b\x32\x13.bidirectional.Data2\xc4\x01\n\x06Simple\x12\x33\n\x07Process\x12\x13.bidirectional.Data\x1a\x13.bidirectional.Data\x12=\n\rProcessStream\x12\x13.bidirectional.Data\x1a\x13.bidirectional.Data(\x01\x30\x01\x12\x46\n\x0cProcessBatch\x12\x18.bidirectional.DataBatch\x1a\x18.bidirectional.DataBatch(\x01\x30\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'python_project.grpc.bidirectional_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_DATA']._serialized_start=58
+  _globals['_DATA']._serialized_end=96
+  _globals['_DATABATCH']._serialized_start=98
+  _globals['_DATABATCH']._serialized_end=145
+  _globals['_SIMPLE']._serialized_start=148
+  _globals['_SIMPLE']._serialized_end=344
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,190 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from python_project.grpc import bidirectional_pb2 as python__project_dot_grpc_dot_bidirectional__pb2
+
+GRPC_GENERATED_VERSION = '1.83.1'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in python_project/grpc/bidirectional_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class SimpleStub:
+    """Simple processing service: the server receives Data and returns Data.
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.Process = channel.unary_unary(
+                '/bidirectional.Simple/Process',
+                request_serializer=python__project_dot_grpc_dot_bidirectional__pb2.Data.SerializeToString,
+                response_deserializer=python__project_dot_grpc_dot_bidirectional__pb2.Data.FromString,
+                _registered_method=True)
+        self.ProcessStream = channel.stream_stream(
+                '/bidirectional.Simple/ProcessStream',
+                request_serializer=python__project_dot_grpc_dot_bidirectional__pb2.Data.SerializeToString,
+                response_deserializer=python__project_dot_grpc_dot_bidirectional__pb2.Data.FromString,
+                _registered_method=True)
+        self.ProcessBatch = channel.stream_stream(
+                '/bidirectional.Simple/ProcessBatch',
+                request_serializer=python__project_dot_grpc_dot_bidirectional__pb2.DataBatch.SerializeToString,
+                response_deserializer=python__project_dot_grpc_dot_bidirectional__pb2.DataBatch.FromString,
+                _registered_method=True)
+
+
+class SimpleServicer:
+    """Simple processing service: the server receives Data and returns Data.
+    """
+
+    def Process(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ProcessStream(self, request_iterator, context):
+        """Persistent bidirectional stream: one Data in, one Data out per call,
+        without per-call HTTP/2 stream setup.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ProcessBatch(self, request_iterator, context):
+        """Batched variant of ProcessStream: each DataBatch in yields one
+        DataBatch out, with the items processed concurrently.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_SimpleServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'Process': grpc.unary_unary_rpc_method_handler(
+                    servicer.Process,
+                    request_deserializer=python__project_dot_grpc_dot_bidirectional__pb2.Data.FromString,
+                    response_serializer=python__project_dot_grpc_dot_bidirectional__pb2.Data.SerializeToString,
+            ),
+            'ProcessStream': grpc.stream_stream_rpc_method_handler(
+                    servicer.ProcessStream,
+                    request_deserializer=python__project_dot_grpc_dot_bidirectional__pb2.Data.FromString,
+                    response_serializer=python__project_dot_grpc_dot_bidirectional__pb2.Data.SerializeToString,
+            ),
+            'ProcessBatch': grpc.stream_stream_rpc_method_handler(
+                    servicer.ProcessBatch,
+                    request_deserializer=python__project_dot_grpc_dot_bidirectional__pb2.DataBatch.FromString,
+                    response_serializer=python__project_dot_grpc_dot_bidirectional__pb2.DataBatch.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'bidirectional.Simple', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('bidirectional.Simple', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class Simple:
+    """Simple processing service: the server receives Data and returns Data.
+    """
+
+    @staticmethod
+    def Process(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/bidirectional.Simple/Process',
+            python__project_dot_grpc_dot_bidirectional__pb2.Data.SerializeToString,
+            python__project_dot_grpc_dot_bidirectional__pb2.Data.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ProcessStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/bidirectional.Simple/ProcessStream',
+            python__project_dot_grpc_dot_bidirectional__pb2.Data.SerializeToString,
+            python__project_dot_grpc_dot_bidirectional__pb2.Data.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ProcessBatch(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/bidirectional.Simple/ProcessBatch',
+            python__project_dot_grpc_dot_bidirectional__pb2.DataBatch.SerializeToString,
+            python__project_dot_grpc_dot_bidirectional__pb2.DataBatch.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
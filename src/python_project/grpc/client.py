@@ -0,0 +1,289 @@
+"""
+gRPC client for sending Data messages to the processing server.
+"""
+import asyncio
+import logging
+import queue
+import threading
+from typing import Iterator, List, Optional, Tuple
+
+import grpc
+
+from . import bidirectional_pb2
+from . import bidirectional_pb2_grpc
+
+# Bound once: saves a module-attribute lookup per message construction
+_Data = bidirectional_pb2.Data
+
+logger = logging.getLogger(__name__)
+
+# Channel options tuned for high-concurrency unary traffic:
+# - a distinct local subchannel pool per channel defeats gRPC's connection
+#   sharing, so each channel really is a separate TCP connection
+# - keepalives keep idle connections from being dropped by middleboxes
+_CHANNEL_OPTIONS = [
+    ('grpc.use_local_subchannel_pool', 1),
+    ('grpc.max_concurrent_streams', 1000),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.keepalive_time_ms', 60000),
+    ('grpc.keepalive_permit_without_calls', 1),
+]
+
+
+class ChannelPool:
+    """
+    Pool of gRPC channels with round-robin stub selection.
+
+    A single HTTP/2 connection suffers head-of-line blocking and is capped
+    at ~100 concurrent streams by most servers. Spreading calls over several
+    TCP connections scales aggregate throughput near-linearly up to ~4
+    connections.
+    """
+
+    def __init__(self, address: str, size: int = 4):
+        """
+        Initialize the channel pool.
+
+        Args:
+            address: Server address (e.g., 'localhost:50051')
+            size: Number of channels to open
+        """
+        self._channels: List[grpc.Channel] = []
+        self._stubs: List[bidirectional_pb2_grpc.SimpleStub] = []
+        for i in range(size):
+            # The distinct 'channel_id' option makes each channel's args
+            # unique so gRPC cannot collapse them onto one subchannel.
+            channel = grpc.insecure_channel(
+                address,
+                options=_CHANNEL_OPTIONS + [('channel_id', i)]
+            )
+            self._channels.append(channel)
+            self._stubs.append(bidirectional_pb2_grpc.SimpleStub(channel))
+        self._index = 0
+        self._lock = threading.Lock()
+        logger.info("Opened channel pool of %s channels to %s", size, address)
+
+    def next_stub(self) -> bidirectional_pb2_grpc.SimpleStub:
+        """Return the next stub in round-robin order (thread-safe)."""
+        with self._lock:
+            stub = self._stubs[self._index]
+            self._index = (self._index + 1) % len(self._stubs)
+        return stub
+
+    def warm(self, timeout: float = 5.0):
+        """
+        Block until every channel's TCP + HTTP/2 handshake has completed.
+
+        Channels connect lazily, so without this the first RPC on each
+        channel pays the full handshake. Call once after construction to
+        move that cost to startup.
+
+        Args:
+            timeout: Seconds to wait per channel before giving up
+        """
+        for channel in self._channels:
+            grpc.channel_ready_future(channel).result(timeout=timeout)
+
+    def close(self):
+        """Close all channels in the pool."""
+        for channel in self._channels:
+            channel.close()
+        self._channels = []
+        self._stubs = []
+
+
+class SimpleClient:
+    """gRPC client that sends Data messages via a pooled set of channels."""
+
+    def __init__(self, address: str = 'localhost:50051', pool_size: int = 4):
+        """
+        Initialize the client.
+
+        Args:
+            address: Server address (e.g., 'localhost:50051')
+            pool_size: Number of channels in the connection pool
+        """
+        self.address = address
+        self.pool_size = pool_size
+        self.pool: Optional[ChannelPool] = None
+        self._req_q: Optional[queue.Queue] = None
+        self._resp_iter: Optional[Iterator] = None
+        self._stream_lock = threading.Lock()
+
+    def connect(self, warm: bool = False):
+        """
+        Open the channel pool and the persistent processing stream.
+
+        Args:
+            warm: Block until all pooled channels finish their handshakes,
+                  so the first real call is served in microseconds instead
+                  of paying connection setup
+        """
+        if self.pool is None:
+            self.pool = ChannelPool(self.address, size=self.pool_size)
+            if warm:
+                self.pool.warm()
+            # One long-lived bidirectional stream: requests are fed from a
+            # queue and `iter(q.get, None)` terminates when None is enqueued.
+            self._req_q = queue.Queue()
+            self._resp_iter = self.pool.next_stub().ProcessStream(
+                iter(self._req_q.get, None)
+            )
+            logger.info("Connected to gRPC server at %s", self.address)
+
+    def process_data(self, value: int, payload: bytes) -> Tuple[int, bytes]:
+        """
+        Send one Data message over the persistent stream and wait for the
+        processed response.
+
+        Each call costs two HTTP/2 DATA frames instead of a full
+        HEADERS+DATA+RST_STREAM stream setup per RPC.
+
+        Args:
+            value: Application-level sequence value
+            payload: Payload bytes
+
+        Returns:
+            Tuple of (value, payload) from the response
+        """
+        if self.pool is None:
+            self.connect()
+        request = _Data(value=value, payload=payload)
+        # The server answers in order, so pairing request to response just
+        # needs the send+receive to be atomic across threads.
+        with self._stream_lock:
+            self._req_q.put(request)
+            response = next(self._resp_iter)
+        return response.value, response.payload
+
+    def process_data_async(self, value: int, payload: bytes) -> grpc.Future:
+        """
+        Send one Data message as a unary call without waiting.
+
+        HTTP/2 multiplexes streams, so issuing many calls as futures and
+        collecting them afterwards pipelines them instead of paying one
+        RTT per call. Combined with the channel pool, the calls also
+        spread over multiple connections.
+
+        Args:
+            value: Application-level sequence value
+            payload: Payload bytes
+
+        Returns:
+            A gRPC future resolving to the response Data message
+        """
+        if self.pool is None:
+            self.connect()
+        request = _Data(value=value, payload=payload)
+        return self.pool.next_stub().Process.future(request)
+
+    def disconnect(self):
+        """Close the stream and the channel pool."""
+        if self.pool is not None:
+            if self._req_q is not None:
+                self._req_q.put(None)
+                self._req_q = None
+                self._resp_iter = None
+            self.pool.close()
+            self.pool = None
+            logger.info("Disconnected from gRPC server")
+
+
+class AsyncSimpleClient:
+    """
+    asyncio gRPC client for the Data processing service.
+
+    grpc.aio multiplexes many outstanding RPCs from a single coroutine
+    without a blocked thread per call, and the channel compresses the
+    repetitive payload field with gzip.
+    """
+
+    def __init__(self, address: str = 'localhost:50051'):
+        """
+        Initialize the client.
+
+        Args:
+            address: Server address (e.g., 'localhost:50051')
+        """
+        self.address = address
+        self.channel: Optional[grpc.aio.Channel] = None
+        self.stub: Optional[bidirectional_pb2_grpc.SimpleStub] = None
+
+    async def connect(self, warm: bool = False):
+        """
+        Open the channel to the server.
+
+        Args:
+            warm: Await channel readiness so the first RPC does not pay
+                  the TCP + HTTP/2 handshake
+        """
+        if self.channel is None:
+            self.channel = grpc.aio.insecure_channel(
+                self.address,
+                compression=grpc.Compression.Gzip,
+                options=_CHANNEL_OPTIONS
+            )
+            self.stub = bidirectional_pb2_grpc.SimpleStub(self.channel)
+            if warm:
+                await self.channel.channel_ready()
+            logger.info("Connected to gRPC server at %s", self.address)
+
+    async def process_data(self, value: int, payload: bytes) -> Tuple[int, bytes]:
+        """
+        Send one Data message and await the processed response.
+
+        Many calls can be in flight concurrently, e.g. via
+        asyncio.gather over a batch.
+
+        Args:
+            value: Application-level sequence value
+            payload: Payload bytes
+
+        Returns:
+            Tuple of (value, payload) from the response
+        """
+        if self.channel is None:
+            await self.connect()
+        request = _Data(value=value, payload=payload)
+        response = await self.stub.Process(request)
+        return response.value, response.payload
+
+    async def process_many(
+        self,
+        items: List[Tuple[int, bytes]],
+        concurrency: int = 64
+    ) -> List[Tuple[int, bytes]]:
+        """
+        Send a batch of Data messages concurrently and collect responses.
+
+        The RPCs overlap on the multiplexed channel instead of paying one
+        round trip per item; a semaphore bounds how many are in flight so
+        large batches do not exhaust the stream window.
+
+        Args:
+            items: List of (value, payload) tuples to send
+            concurrency: Maximum RPCs in flight at once
+
+        Returns:
+            List of (value, payload) responses, in input order
+        """
+        if self.channel is None:
+            await self.connect()
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(value: int, payload: bytes):
+            async with sem:
+                response = await self.stub.Process(
+                    _Data(value=value, payload=payload))
+                return response.value, response.payload
+
+        return list(await asyncio.gather(
+            *(_one(value, payload) for value, payload in items)))
+
+    async def disconnect(self):
+        """Close the channel."""
+        if self.channel is not None:
+            await self.channel.close()
+            self.channel = None
+            self.stub = None
+            logger.info("Disconnected from gRPC server")
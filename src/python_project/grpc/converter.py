@@ -2,9 +2,106 @@
 Framework for converting between NDN Interest/Data packets and gRPC messages.
 This is a placeholder framework - actual conversion logic to be implemented.
 """
+import base64
+import json
+import re
 from typing import Optional, Dict, Any
 from ndn.encoding import Name, FormalName
 
+from . import bidirectional_pb2
+
+# Bound once: saves a module-attribute lookup per message construction
+_Data = bidirectional_pb2.Data
+# C-implemented classmethod: constructs and parses in one call
+_data_from_string = bidirectional_pb2.Data.FromString
+
+# orjson is a C implementation with no per-character Python dispatch;
+# fall back to stdlib json when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Matches '/grpc/process/<value>' with an optional payload suffix.
+# Compiled once: a single pass over the name, no split/join or exceptions.
+_GRPC_NAME_RE = re.compile(r'^/grpc/process/(\d+)(?:/(.*))?$')
+
+
+def interest_name_to_grpc_request(name: str) -> bidirectional_pb2.Data:
+    """
+    Build a gRPC Data request from an NDN Interest name string.
+
+    Names of the form '/grpc/process/<value>[/payload]' map to a Data
+    message with that value; anything else becomes a value-0 request
+    carrying the raw name as payload.
+
+    Args:
+        name: NDN Interest name string
+
+    Returns:
+        gRPC Data request message
+    """
+    m = _GRPC_NAME_RE.match(name)
+    if m:
+        payload = m.group(2) or f"from_ndn_{m.group(1)}"
+        return _Data(value=int(m.group(1)), payload=payload.encode())
+    return _Data(value=0, payload=name.encode())
+
+
+def grpc_data_to_data_content(
+    grpc_data: bidirectional_pb2.Data,
+    legacy_json: bool = False
+) -> bytes:
+    """
+    Serialize a gRPC Data message to NDN Data packet content bytes.
+
+    The default wire format is the protobuf binary encoding, which uses the
+    native protobuf serializer and roughly halves the bytes on the wire
+    compared to JSON. Pass legacy_json=True for peers still expecting the
+    JSON format.
+
+    Args:
+        grpc_data: gRPC Data message
+        legacy_json: Use the legacy JSON wire format instead of protobuf
+
+    Returns:
+        Content bytes for an NDN Data packet
+    """
+    if not legacy_json:
+        return grpc_data.SerializeToString()
+    obj = {
+        'value': grpc_data.value,
+        'payload': base64.b64encode(grpc_data.payload).decode('ascii'),
+    }
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def data_content_to_grpc_data(
+    content: bytes,
+    legacy_json: bool = False
+) -> bidirectional_pb2.Data:
+    """
+    Parse NDN Data packet content bytes back into a gRPC Data message.
+
+    Args:
+        content: Content bytes (or any bytes-like view) from an NDN Data
+                 packet; memoryviews are parsed without copying
+        legacy_json: Content is in the legacy JSON wire format
+
+    Returns:
+        gRPC Data message
+    """
+    if not legacy_json:
+        return _data_from_string(content)
+    obj = orjson.loads(content) if orjson is not None else json.loads(content)
+    return _Data(
+        value=obj['value'],
+        payload=base64.b64decode(obj['payload']),
+    )
+
 
 class NDNGRPCConverter:
     """
@@ -22,52 +119,66 @@ class NDNGRPCConverter:
     def interest_to_grpc(self, name: FormalName, interest_param: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Convert NDN Interest packet to gRPC request message.
-        
+
+        The name travels as its TLV encoding ('name_tlv', bytes) rather
+        than a string, avoiding a UTF-8 decode/encode and '/'-split
+        re-parse per packet. Convert to string only for logging.
+
         Args:
             name: NDN Interest name
             interest_param: Optional Interest parameters
-            
+
         Returns:
             Dictionary representing gRPC request message
         """
-        # TODO: Implement actual conversion logic
         return {
-            'name': Name.to_str(name),
+            'name_tlv': Name.to_bytes(name),
             'interest_param': interest_param or {},
             'type': 'interest'
         }
-    
+
     def grpc_to_interest(self, grpc_message: Dict[str, Any]) -> tuple[FormalName, Optional[Dict]]:
         """
         Convert gRPC request message to NDN Interest packet.
-        
+
         Args:
             grpc_message: Dictionary representing gRPC request message
-            
+
         Returns:
             Tuple of (name, interest_param)
         """
-        # TODO: Implement actual conversion logic
-        name = Name.from_str(grpc_message.get('name', '/'))
+        name = self._name_from_message(grpc_message)
         interest_param = grpc_message.get('interest_param')
         return name, interest_param
     
-    def data_to_grpc(self, name: FormalName, content: bytes, meta_info: Optional[Dict] = None) -> Dict[str, Any]:
+    def data_to_grpc(
+        self,
+        name: FormalName,
+        content: bytes,
+        meta_info: Optional[Dict] = None,
+        text_safe: bool = False
+    ) -> Dict[str, Any]:
         """
         Convert NDN Data packet to gRPC response message.
-        
+
+        Content passes through as raw bytes by default. For JSON-only
+        sinks, text_safe=True base64-encodes it (C implementation, ~1.33x
+        expansion vs the 2x of hex).
+
         Args:
             name: NDN Data name
             content: Data content bytes
             meta_info: Optional metadata information
-            
+            text_safe: Base64-encode content for text-only transports
+
         Returns:
             Dictionary representing gRPC response message
         """
-        # TODO: Implement actual conversion logic
+        if text_safe:
+            content = base64.b64encode(content).decode('ascii')
         return {
-            'name': Name.to_str(name),
-            'content': content.hex(),  # Convert bytes to hex string for JSON
+            'name_tlv': Name.to_bytes(name),
+            'content': content,
             'meta_info': meta_info or {},
             'type': 'data'
         }
@@ -82,10 +193,19 @@ class NDNGRPCConverter:
         Returns:
             Tuple of (name, content, meta_info)
         """
-        # TODO: Implement actual conversion logic
-        name = Name.from_str(grpc_message.get('name', '/'))
-        content_hex = grpc_message.get('content', '')
-        content = bytes.fromhex(content_hex) if content_hex else b''
+        name = self._name_from_message(grpc_message)
+        content = grpc_message.get('content', b'')
+        if isinstance(content, str):
+            # Text-safe messages carry base64-encoded content
+            content = base64.b64decode(content) if content else b''
         meta_info = grpc_message.get('meta_info')
         return name, content, meta_info
 
+    @staticmethod
+    def _name_from_message(grpc_message: Dict[str, Any]) -> FormalName:
+        """Extract the NDN name, preferring the TLV form over legacy string."""
+        name_tlv = grpc_message.get('name_tlv')
+        if name_tlv is not None:
+            return Name.from_bytes(name_tlv)
+        return Name.from_str(grpc_message.get('name', '/'))
+
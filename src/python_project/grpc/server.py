@@ -0,0 +1,594 @@
+"""
+gRPC server for the Data processing service.
+
+Besides the plain synchronous echo server, this module provides an
+asyncio bridge server that forwards each gRPC request as an NDN
+Interest and returns the Data content as the gRPC response.
+"""
+import asyncio
+import collections
+import functools
+import logging
+import os
+import signal
+import time
+from concurrent import futures
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+import grpc
+
+from . import bidirectional_pb2
+from . import bidirectional_pb2_grpc
+from ..config import get_config
+# python-ndn is imported lazily (inside the NDN-enabled paths) so the
+# plain echo server does not pay the NDNApp/Keychain import cost
+if TYPE_CHECKING:
+    from ndn.encoding import FormalName
+
+logger = logging.getLogger(__name__)
+
+# Bound once: saves a module-attribute lookup per message construction
+_Data = bidirectional_pb2.Data
+_DataBatch = bidirectional_pb2.DataBatch
+# Both sides speak protobuf, so NDN Data content parses straight into a
+# gRPC response with the C-implemented classmethod; the converter module
+# stays the entry point for the heterogeneous (legacy JSON) case
+_data_from_string = bidirectional_pb2.Data.FromString
+
+# Server-side HTTP/2 tuning: defaults cap concurrent streams per
+# connection and use small frames; high-throughput gRPC needs explicit
+# limits. so_reuseport allows several listener processes on one port.
+_SERVER_OPTIONS = [
+    # Streams per connection; the HTTP/2 default of 100 throttles pooled
+    # clients issuing pipelined calls
+    ('grpc.max_concurrent_streams', 1000),
+    # Large frames batch small messages into fewer write() syscalls
+    ('grpc.http2.max_frame_size', 16 * 1024 * 1024),
+    # Let multiple server processes share the port (see run_server_multi)
+    ('grpc.so_reuseport', 1),
+    # Raise the 4MB default so large payloads need not fragment
+    ('grpc.max_send_message_length', 8 << 20),
+    ('grpc.max_receive_message_length', 8 << 20),
+    # Probe idle connections every 60s, declare them dead after 20s
+    ('grpc.keepalive_time_ms', 60000),
+    ('grpc.keepalive_timeout_ms', 20000),
+    # Allow keepalive pings on idle connections instead of resetting them
+    ('grpc.http2.max_pings_without_data', 0),
+]
+
+# Options for the asyncio bridge server: raise the 4MB default message
+# cap (large payloads would otherwise fragment) and use 1MB frames
+_AIO_SERVER_OPTIONS = [
+    ('grpc.max_send_message_length', 64 * 1024 * 1024),
+    ('grpc.max_receive_message_length', 64 * 1024 * 1024),
+    ('grpc.max_concurrent_streams', 1024),
+    ('grpc.so_reuseport', 1),
+    ('grpc.http2.max_frame_size', 1 << 20),
+    ('grpc.keepalive_time_ms', 60000),
+    ('grpc.keepalive_timeout_ms', 20000),
+]
+
+# Upper bound on concurrently handled RPCs. Beyond this, gRPC rejects
+# with RESOURCE_EXHAUSTED instead of queuing unboundedly, so overload
+# surfaces as backpressure to clients rather than server memory growth.
+_MAX_CONCURRENT_RPCS = 1024
+
+
+class SimpleService(bidirectional_pb2_grpc.SimpleServicer):
+    """Service that processes Data messages and returns Data messages."""
+
+    def Process(self, request, context):
+        """Process one Data message (echo semantics for now)."""
+        logger.debug("Processing Data: value=%s", request.value)
+        # gRPC does not retain the inbound message after the handler
+        # returns, so echoing it back avoids a full payload copy into a
+        # fresh protobuf
+        return request
+
+    def ProcessStream(self, request_iterator, context):
+        """Process Data messages over the persistent stream, in order."""
+        for request in request_iterator:
+            logger.debug("Processing streamed Data: value=%s", request.value)
+            yield request
+
+    def ProcessBatch(self, request_iterator, context):
+        """Process batches of Data messages, one DataBatch out per batch in."""
+        for batch in request_iterator:
+            logger.debug("Processing batch of %s Data items", len(batch.items))
+            yield batch
+
+
+def create_server(
+    address: str = '[::]:50051',
+    max_workers: Optional[int] = None
+) -> grpc.Server:
+    """
+    Create a tuned gRPC server with the Simple service registered.
+
+    Args:
+        address: Address to bind (e.g., '[::]:50051')
+        max_workers: Thread pool size; defaults to 4x the CPU count
+
+    Returns:
+        The configured (not yet started) gRPC server
+    """
+    if max_workers is None:
+        max_workers = (os.cpu_count() or 1) * 4
+    server = grpc.server(
+        # Named threads show up usefully in profilers and py-spy dumps
+        futures.ThreadPoolExecutor(max_workers=max_workers,
+                                   thread_name_prefix='grpc-worker'),
+        options=_SERVER_OPTIONS,
+        maximum_concurrent_rpcs=_MAX_CONCURRENT_RPCS
+    )
+    bidirectional_pb2_grpc.add_SimpleServicer_to_server(SimpleService(), server)
+    server.add_insecure_port(address)
+    return server
+
+
+@dataclass
+class InterestRequest:
+    """One queued NDN Interest issued on behalf of a gRPC request."""
+    # Manual __slots__ (dataclass slots=True needs 3.10, we support 3.8):
+    # no per-instance __dict__, smaller objects, direct-offset attribute
+    # access on the hot path
+    __slots__ = ('name', 'lifetime', 'future')
+    name: 'FormalName'
+    lifetime: int
+    future: asyncio.Future
+
+
+# Interest hand-off between the gRPC handlers and the NDN client. The
+# NDN client runs as a task on the same loop as the gRPC server, so the
+# hand-off is a plain deque (append/popleft take no lock) with an
+# asyncio.Event to wake the consumer.
+_ndn_buf: collections.deque = collections.deque()
+_ndn_event: Optional[asyncio.Event] = None
+
+# Set (on the gRPC loop) once the NDN client has connected; handlers
+# wait on it instead of probing with retries
+_ndn_connected: Optional[asyncio.Event] = None
+
+# Free list of InterestRequest objects; reusing them avoids an
+# allocation per RPC under sustained load (futures stay per-call since
+# asyncio futures are not reusable)
+_req_pool: collections.deque = collections.deque(maxlen=1024)
+
+# In-flight Interests keyed by (name, request payload): concurrent gRPC
+# requests for the same Data await one shared future instead of issuing
+# N identical Interests
+_inflight: dict = {}
+
+# Response cache at the gRPC edge: NDN Data is immutable for the
+# Interest's freshness window, so duplicate RPCs inside it are O(1)
+# dict hits instead of NDN round trips - a content store for the bridge.
+# OrderedDict gives LRU eviction; entries carry a monotonic expiry.
+_RESP_CACHE_SIZE = 4096
+_resp_cache: 'collections.OrderedDict' = collections.OrderedDict()
+_monotonic = time.monotonic
+
+
+async def _handle_interest(ndn_client, req: InterestRequest):
+    """Express one queued Interest and resolve its future."""
+    try:
+        result = await ndn_client.express_interest(req.name,
+                                                   lifetime=req.lifetime)
+    except Exception as e:
+        logger.error("Error expressing queued Interest: %s", e)
+        logger.debug("Traceback:", exc_info=True)
+        # The waiter may have been cancelled (client cancel/deadline)
+        # while the Interest was in flight; resolving a done future
+        # raises InvalidStateError inside this task
+        if not req.future.done():
+            req.future.set_exception(e)
+    else:
+        if not req.future.done():
+            req.future.set_result(result)
+
+
+async def consume_interest_queue(ndn_client):
+    """Drain queued Interests, spawning one task per Interest."""
+    while True:
+        while not _ndn_buf:
+            await _ndn_event.wait()
+            _ndn_event.clear()
+        # Fire-and-continue: each Interest runs as its own task, so the
+        # consumer loops straight back to the queue and a slow NDN round
+        # trip never delays submission of the ones behind it. Outstanding
+        # Interests are bounded by the server's RPC cap.
+        while _ndn_buf:
+            asyncio.ensure_future(
+                _handle_interest(ndn_client, _ndn_buf.popleft()))
+
+
+# Status codes hoisted once; each grpc.StatusCode.X access is an enum
+# attribute lookup otherwise repeated per error RPC
+_INTERNAL = grpc.StatusCode.INTERNAL
+_DEADLINE_EXCEEDED = grpc.StatusCode.DEADLINE_EXCEEDED
+_UNAVAILABLE = grpc.StatusCode.UNAVAILABLE
+
+
+def _grpc_error_wrap(fn):
+    """
+    Translate handler exceptions into gRPC error statuses.
+
+    Keeping the try/except out of the handler body keeps the hot success
+    path small and shares the translation across handler variants.
+    abort() raises into gRPC core once, instead of the three separate
+    set_code/set_details/return transitions.
+    """
+    @functools.wraps(fn)
+    async def wrapper(self, request, context):
+        try:
+            return await fn(self, request, context)
+        except grpc.aio.AbortError:
+            raise
+        except asyncio.TimeoutError:
+            await context.abort(_DEADLINE_EXCEEDED,
+                                'Timeout waiting for NDN Data')
+        except Exception as e:
+            await context.abort(_INTERNAL, f'Error: {e}')
+    return wrapper
+
+
+class AsyncSimpleService(bidirectional_pb2_grpc.SimpleServicer):
+    """
+    asyncio service bridging gRPC requests to NDN Interests.
+
+    With enable_ndn, each Process call expresses the configured Interest
+    and returns the Data content, parsed back into a gRPC Data message.
+    Without it, requests are echoed like the synchronous service.
+    """
+
+    def __init__(self, config=None, enable_ndn: bool = True):
+        """
+        Initialize the service.
+
+        Args:
+            config: Optional Config instance (defaults to get_config())
+            enable_ndn: Bridge requests to NDN when an Interest is configured
+        """
+        self.config = config or get_config()
+        # Config is static for the server's lifetime: resolve everything
+        # once here instead of walking dicts on every RPC
+        client_config = self.config.get_client_config()
+        interests = client_config.get('interests', [])
+        self._interest_name = interests[0] if interests else None
+        # Parse the Interest names once; python-ndn would otherwise
+        # re-tokenize the URI strings on every request. Imported here so
+        # echo-only servers never load python-ndn.
+        if interests:
+            from ndn.encoding import Name
+            self._interest_name_obj = Name.from_str(self._interest_name)
+            self._interest_names_obj = [Name.from_str(n) for n in interests]
+        else:
+            self._interest_name_obj = None
+            self._interest_names_obj = []
+        self._interest_lifetime = client_config.get('interest_lifetime', 4000)
+        self._disable_cache = self.config.get_client_disable_cache()
+        # Hedging fans each request out over every configured Interest
+        # name and takes the first Data that arrives; NDN aggregates
+        # duplicate Interests in-network, so the extra cost is small
+        self._hedge = (self.config.get_client_hedge_interests()
+                       and len(interests) > 1)
+        if enable_ndn and self._interest_name is None:
+            logger.warning("NDN bridging requested but client.interests is "
+                           "empty; falling back to echo mode")
+        self.enable_ndn = enable_ndn and self._interest_name is not None
+        # Specialize the handler once: each variant is straight-line code
+        # with no per-RPC mode branches
+        self.Process = (self._process_ndn if self.enable_ndn
+                        else self._process_echo)
+
+    async def _process_echo(self, request, context):
+        """Echo one Data message (NDN bridging disabled)."""
+        logger.debug("Received gRPC request: value=%s", request.value)
+        # Reuse the inbound message rather than copying the payload into
+        # a new protobuf
+        return request
+
+    @_grpc_error_wrap
+    async def _process_ndn(self, request, context):
+        """Bridge one Data message to the configured NDN Interest."""
+        # Per-request logs sit at DEBUG with deferred formatting: at 10k
+        # RPS, eager f-strings alone are measurable allocation churn. The
+        # payload accessor is guarded because touching it costs real time
+        # for large messages.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received gRPC request: value=%s payload=%s bytes",
+                         request.value, len(request.payload))
+
+        # Wait for NDN bring-up once instead of retrying failed sends
+        if not _ndn_connected.is_set():
+            await asyncio.wait_for(_ndn_connected.wait(), timeout=5.0)
+
+        if self._hedge:
+            content = await self._express_hedged()
+            if content is None:
+                await context.abort(_UNAVAILABLE, 'No Data received from NDN')
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received Data from NDN, content length: %s",
+                             len(content))
+            return _data_from_string(content)
+
+        key = (self._interest_name, request.payload)
+        if not self._disable_cache:
+            hit = _resp_cache.get(key)
+            if hit is not None:
+                if hit[0] > _monotonic():
+                    _resp_cache.move_to_end(key)
+                    return _data_from_string(hit[1])
+                del _resp_cache[key]
+        fut = None if self._disable_cache else _inflight.get(key)
+        if fut is None:
+            fut = asyncio.get_running_loop().create_future()
+            if not self._disable_cache:
+                _inflight[key] = fut
+            if _req_pool:
+                req = _req_pool.pop()
+                req.name = self._interest_name_obj
+                req.lifetime = self._interest_lifetime
+                req.future = fut
+            else:
+                req = InterestRequest(self._interest_name_obj,
+                                      self._interest_lifetime, fut)
+            _ndn_buf.append(req)
+            _ndn_event.set()
+            try:
+                content = await fut
+            finally:
+                # Followers already hold a reference to the future
+                _inflight.pop(key, None)
+                # Recycle only once the Interest task has resolved the
+                # future. On cancellation (client cancel/deadline) the
+                # req may still sit in _ndn_buf or in a running task;
+                # rebinding it would deliver that stale Interest's Data
+                # to the next RPC. Unrecycled reqs just fall to the GC.
+                if fut.done() and not fut.cancelled():
+                    req.future = None
+                    _req_pool.append(req)
+        else:
+            content = await fut
+        if content is None:
+            await context.abort(_UNAVAILABLE, 'No Data received from NDN')
+        if not self._disable_cache:
+            # Cache for the Interest lifetime (the freshness window the
+            # producer promised); LRU-evict beyond the size cap
+            _resp_cache[key] = (
+                _monotonic() + self._interest_lifetime / 1000.0, content)
+            if len(_resp_cache) > _RESP_CACHE_SIZE:
+                _resp_cache.popitem(last=False)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received Data from NDN, content length: %s",
+                         len(content))
+        # content may be a memoryview over the NDN packet buffer; the
+        # protobuf parser accepts bytes-like objects, so no copy is made
+        return _data_from_string(content)
+
+    async def _express_hedged(self) -> Optional[bytes]:
+        """
+        Issue every configured Interest concurrently and return the first
+        Data content that arrives.
+
+        Classic hedging: alternate names may resolve from a closer
+        in-network cache, cutting tail latency. Later arrivals are
+        dropped on the floor. Requests are built fresh here (not from
+        the free list) since the losers outlive this call.
+        """
+        loop = asyncio.get_running_loop()
+        futs = []
+        for name_obj in self._interest_names_obj:
+            fut = loop.create_future()
+            _ndn_buf.append(InterestRequest(name_obj,
+                                            self._interest_lifetime, fut))
+            futs.append(fut)
+        _ndn_event.set()
+        pending = set(futs)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED)
+            for fut in done:
+                if fut.exception() is None and fut.result() is not None:
+                    # Losers still resolve later; retrieve their results
+                    # so asyncio does not log unconsumed exceptions
+                    for other in pending:
+                        other.add_done_callback(
+                            lambda f: f.cancelled() or f.exception())
+                    return fut.result()
+        return None
+
+    async def ProcessStream(self, request_iterator, context):
+        """
+        Process streamed Data messages, responses in request order.
+
+        Handling is pipelined: a reader task spawns one handler task per
+        inbound message as it arrives, so many NDN round trips overlap
+        on the single HTTP/2 stream. Responses are still yielded FIFO
+        because stream clients pair requests to responses positionally.
+        """
+        pending: asyncio.Queue = asyncio.Queue()
+
+        async def _reader():
+            async for request in request_iterator:
+                pending.put_nowait(
+                    asyncio.ensure_future(self.Process(request, context)))
+            pending.put_nowait(None)
+
+        reader = asyncio.ensure_future(_reader())
+        try:
+            while True:
+                task = await pending.get()
+                if task is None:
+                    break
+                yield await task
+        finally:
+            reader.cancel()
+            while not pending.empty():
+                task = pending.get_nowait()
+                if task is not None:
+                    task.cancel()
+
+    async def ProcessBatch(self, request_iterator, context):
+        """
+        Process batches of Data messages, one DataBatch out per batch in.
+
+        A batch arrives as a single gRPC message, so the per-message
+        HTTP/2 framing and dispatch cost is paid once per batch. The
+        items are bridged concurrently: their NDN round trips overlap
+        (and identical Interests coalesce via the in-flight table)
+        instead of running back to back.
+        """
+        async for batch in request_iterator:
+            responses = await asyncio.gather(
+                *(self.Process(item, context) for item in batch.items)
+            )
+            yield _DataBatch(items=responses)
+
+
+def _install_uvloop():
+    """
+    Install uvloop's event loop policy when the package is available.
+
+    uvloop (libuv, implemented in C) cuts the per-callback and Future
+    overhead of the stock selector loop, which dominates under grpc.aio's
+    many small coroutines and timers. Falls back silently to the default
+    loop when uvloop is not installed.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed; using the default event loop")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+async def _run_ndn_client(ndn_client):
+    """Run the NDN client and the queue consumer on the current loop."""
+
+    async def _after_start():
+        # Signal handlers that Interests can be sent
+        _ndn_connected.set()
+        await consume_interest_queue(ndn_client)
+
+    try:
+        await ndn_client.run(after_start=_after_start())
+    except Exception as e:
+        logger.error("NDN client loop terminated: %s", e)
+
+
+async def run_server_async(
+    address: str = '[::]:50051',
+    enable_ndn: bool = True
+):
+    """
+    Run the asyncio bridge server until terminated.
+
+    Args:
+        address: Address to bind (e.g., '[::]:50051')
+        enable_ndn: Bridge requests to NDN when configured
+    """
+    service = AsyncSimpleService(enable_ndn=enable_ndn)
+    ndn_client = None
+
+    if service.enable_ndn:
+        global _ndn_connected, _ndn_event
+        _ndn_connected = asyncio.Event()
+        _ndn_event = asyncio.Event()
+        from ..ndn.client import NDNClient
+        resolved = service.config.resolve()
+        ndn_client = NDNClient(pib_path=resolved.pib_path,
+                               tpm_path=resolved.tpm_path)
+        # One shared loop: no per-request cross-thread wakeup or future
+        # wrapping between the gRPC handlers and the NDN client
+        asyncio.create_task(_run_ndn_client(ndn_client))
+
+    server = grpc.aio.server(options=_AIO_SERVER_OPTIONS,
+                             maximum_concurrent_rpcs=_MAX_CONCURRENT_RPCS)
+    bidirectional_pb2_grpc.add_SimpleServicer_to_server(service, server)
+    server.add_insecure_port(address)
+    await server.start()
+    logger.info("Async gRPC server started on %s (NDN bridge: %s)",
+                address, service.enable_ndn)
+
+    # Deterministic shutdown: wait on an event set by SIGTERM/SIGINT
+    # instead of racing KeyboardInterrupt against gRPC's own signal
+    # handling; orchestrators (k8s) get the graceful stop immediately
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            # Signal handlers are Unix-only; fall back to Ctrl+C raising
+            # KeyboardInterrupt out of the wait below
+            break
+    try:
+        await stop.wait()
+    finally:
+        logger.info("Shutting down async gRPC server...")
+        await server.stop(grace=5)
+        if ndn_client is not None:
+            ndn_client.shutdown()
+
+
+def run_bridge_server(address: str = '[::]:50051', enable_ndn: bool = True):
+    """
+    Run the asyncio bridge server from synchronous code.
+
+    Args:
+        address: Address to bind (e.g., '[::]:50051')
+        enable_ndn: Bridge requests to NDN when configured
+    """
+    _install_uvloop()
+    asyncio.run(run_server_async(address, enable_ndn=enable_ndn))
+
+
+def run_server_multi(address: str = '[::]:50051', workers: Optional[int] = None):
+    """
+    Run one bridge server process per worker, sharing the port.
+
+    so_reuseport lets the kernel load-balance incoming connections over
+    the processes, which side-steps the GIL serializing protobuf work in
+    a single process - the canonical linear scale-out for Python gRPC.
+
+    Args:
+        address: Address to bind (all workers share it via SO_REUSEPORT)
+        workers: Number of server processes; defaults to the CPU count
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # Set the policy before forking so every worker inherits uvloop
+    _install_uvloop()
+    children = []
+    for _ in range(workers - 1):
+        pid = os.fork()
+        if pid == 0:
+            # Child: module globals (queue, NDN client) are set up fresh
+            # inside run_server_async per process
+            asyncio.run(run_server_async(address))
+            os._exit(0)
+        children.append(pid)
+
+    logger.info("Started %s worker processes on %s", workers, address)
+    try:
+        asyncio.run(run_server_async(address))
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, 15)
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+
+
+def run_server(address: str = '[::]:50051'):
+    """Run the gRPC server until terminated."""
+    server = create_server(address)
+    server.start()
+    logger.info("gRPC server started on %s", address)
+    try:
+        server.wait_for_termination()
+    except KeyboardInterrupt:
+        logger.info("Shutting down gRPC server...")
+        server.stop(grace=2)
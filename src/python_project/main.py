@@ -6,6 +6,7 @@ Supports running in server or client mode via:
 2. Environment variable: MODE=server|client
 3. Configuration file: config.yaml
 """
+import argparse
 import asyncio
 import os
 import sys
@@ -14,45 +15,43 @@ from typing import Optional
 
 from .ndn.client import NDNClient
 from .ndn.server import NDNServer
-from .utils import setup_logging
+from .utils import setup_logging, install_uvloop
 from .config import get_config
 
 logger = logging.getLogger(__name__)
 
 
-def get_mode(config_path: Optional[str] = None) -> Optional[str]:
+def resolve_mode(cli_mode: Optional[str], config_path: Optional[str] = None) -> Optional[str]:
     """
-    Get the running mode (server or client) from various sources.
-    
+    Resolve the running mode (server or client) from various sources.
+
     Priority order:
     1. Command line argument
     2. Environment variable MODE
     3. Configuration file
     4. None (will show usage)
-    
+
     Args:
+        cli_mode: Mode from the command line, if given
         config_path: Optional path to configuration file
-        
+
     Returns:
         'server', 'client', or None
     """
-    # Check command line argument
-    if len(sys.argv) > 1:
-        mode = sys.argv[1].lower()
-        if mode in ['server', 'client']:
-            return mode
-    
+    if cli_mode in ['server', 'client']:
+        return cli_mode
+
     # Check environment variable
     mode = os.getenv('MODE', '').lower()
     if mode in ['server', 'client']:
         return mode
-    
+
     # Check configuration file
     config = get_config(config_path)
     mode = config.get_mode()
     if mode and mode.lower() in ['server', 'client']:
         return mode.lower()
-    
+
     return None
 
 
@@ -89,10 +88,8 @@ async def run_server(config_path: Optional[str] = None):
         logger.warning("No data configured in config file!")
         logger.warning("Please configure 'server.data' in config.yaml")
     else:
-        # Store data
+        # Store data (values are pre-encoded to bytes at config load)
         for name, content in data.items():
-            if isinstance(content, str):
-                content = content.encode()
             server.store_data(name, content)
     
     logger.info("=" * 50)
@@ -159,7 +156,7 @@ async def run_client(config_path: Optional[str] = None):
                 lifetime=interest_lifetime
             )
             if content:
-                logger.info(f"Received content: {content.decode()}")
+                logger.info(f"Received content: {bytes(content).decode()}")
             await asyncio.sleep(1)
         
         logger.info("Demo completed")
@@ -174,17 +171,18 @@ async def run_client(config_path: Optional[str] = None):
 
 def main():
     """Main entry point."""
-    # Check for config file path in command line
-    config_path = None
-    if len(sys.argv) > 1 and sys.argv[1].startswith('--config='):
-        config_path = sys.argv[1].split('=', 1)[1]
-        sys.argv = [sys.argv[0]] + sys.argv[2:]
-    elif '--config' in sys.argv:
-        idx = sys.argv.index('--config')
-        if idx + 1 < len(sys.argv):
-            config_path = sys.argv[idx + 1]
-            sys.argv = sys.argv[:idx] + sys.argv[idx + 2:]
-    
+    # Parse arguments once; attribute access replaces repeated argv scans
+    parser = argparse.ArgumentParser(
+        prog='python -m python_project',
+        description='NDN Interest/Data demo (server or client mode)'
+    )
+    parser.add_argument('mode', choices=['server', 'client'], nargs='?',
+                        help='Running mode (falls back to MODE env or config file)')
+    parser.add_argument('--config', dest='config_path', metavar='PATH',
+                        help='Path to configuration file')
+    args = parser.parse_args()
+    config_path = args.config_path
+
     # Get config and setup logging
     config = get_config(config_path)
     log_level = config.get_log_level()
@@ -195,7 +193,10 @@ def main():
     logger.info("For local testing, you may need to set up NFD (NDN Forwarding Daemon).")
     
     # Get mode from various sources
-    mode = get_mode(config_path)
+    mode = resolve_mode(args.mode, config_path)
+
+    # Swap in uvloop (when installed) before any loop is created
+    install_uvloop()
     
     if mode == 'server':
         try:
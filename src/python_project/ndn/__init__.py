@@ -3,7 +3,7 @@ NDN (Named Data Networking) module for Interest and Data packet handling.
 """
 
 from .client import NDNClient
-from .server import NDNServer
+from .server import NDNServer, bytes_handler
 
-__all__ = ['NDNClient', 'NDNServer']
+__all__ = ['NDNClient', 'NDNServer', 'bytes_handler']
 
@@ -2,9 +2,10 @@
 NDN Client for sending Interest packets and receiving Data packets.
 """
 import asyncio
+import functools
 import logging
 import os
-from typing import Optional
+from typing import Optional, Union
 from ndn.app import NDNApp
 from ndn.encoding import Name, InterestParam, FormalName
 from ndn.security import KeychainSqlite3, TpmFile
@@ -12,9 +13,74 @@ from ndn.security import KeychainSqlite3, TpmFile
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _default_pib_path() -> str:
+    """Default PIB location, resolved once per process.
+
+    expanduser consults the environment (and can stat the passwd
+    database); test suites constructing many clients would otherwise
+    repeat it per instance.
+    """
+    return os.path.join(os.path.expanduser('~'), '.ndn', 'pib.db')
+
+
+def _tune_pib_connection(keychain: KeychainSqlite3) -> None:
+    """Apply read-mostly SQLite pragmas to the keychain's PIB connection.
+
+    The PIB is consulted on the signing path; WAL with synchronous=NORMAL
+    drops the per-write fsync and lets reads proceed during writes, and
+    the in-memory temp store / mmap keep key lookups off the disk. Runs
+    once per keychain, at construction.
+    """
+    try:
+        keychain.conn.executescript(
+            'PRAGMA journal_mode=WAL;'
+            'PRAGMA synchronous=NORMAL;'
+            'PRAGMA temp_store=MEMORY;'
+            'PRAGMA mmap_size=67108864;'
+        )
+    except Exception as e:
+        # Pragmas are an optimization; a read-only or locked PIB still works
+        logger.debug("Could not tune PIB connection: %s", e)
+
+
+@functools.lru_cache(maxsize=256)
+def _formal_name(name: str) -> FormalName:
+    """Memoized Name.from_str: skips URI tokenization for repeated names."""
+    return Name.from_str(name)
+
+
+@functools.lru_cache(maxsize=128)
+def _interest_param(
+    lifetime: int,
+    can_be_prefix: bool,
+    must_be_fresh: bool
+) -> InterestParam:
+    """
+    Shared InterestParam per parameter combination.
+
+    python-ndn only reads the fields while building the packet (no nonce
+    is stamped onto a caller-supplied param), so one instance per
+    combination serves every call with those settings.
+    """
+    return InterestParam(
+        lifetime=lifetime,
+        can_be_prefix=can_be_prefix,
+        must_be_fresh=must_be_fresh
+    )
+
+
+# Shared NDNApp instances keyed by (pib_path, tpm_path), with reference
+# counts so shutdown only tears the app down when the last client using
+# it is done. Each NDNApp owns a socket to NFD plus its own PIT half;
+# one per keychain configuration is enough for a whole process.
+_app_cache: dict = {}
+_app_refs: dict = {}
+
+
 class NDNClient:
     """NDN Client to send Interest packets and receive Data packets."""
-    
+
     def __init__(
         self,
         app: Optional[NDNApp] = None,
@@ -41,55 +107,106 @@ class NDNClient:
             # Create Keychain with custom paths if provided
             if pib_path or tpm_path:
                 tpm = TpmFile(tpm_path) if tpm_path else TpmFile()
-                pib_path = pib_path or os.path.join(os.path.expanduser('~'), '.ndn', 'pib.db')
+                pib_path = pib_path or _default_pib_path()
                 keychain = KeychainSqlite3(pib_path, tpm)
+                _tune_pib_connection(keychain)
                 self.app = NDNApp(keychain=keychain)
-                logger.info(f"Using custom PIB path: {pib_path}")
+                logger.info("Using custom PIB path: %s", pib_path)
                 if tpm_path:
-                    logger.info(f"Using custom TPM path: {tpm_path}")
+                    logger.info("Using custom TPM path: %s", tpm_path)
             else:
                 self.app = NDNApp()
                 logger.debug("Using default PIB and TPM paths")
     
     async def express_interest(
         self,
-        name: str,
+        name: Union[str, FormalName],
         lifetime: int = 4000,
         can_be_prefix: bool = False,
         must_be_fresh: bool = False
-    ) -> Optional[bytes]:
+    ) -> Optional[Union[bytes, memoryview]]:
         """
         Express an Interest packet and wait for Data packet.
-        
+
         Args:
-            name: Name of the Interest (e.g., '/example/data')
+            name: Name of the Interest, either a URI string
+                  (e.g., '/example/data') or an already parsed FormalName.
+                  Callers on a hot path should parse once and pass the
+                  FormalName to skip per-call URI tokenization.
             lifetime: Interest lifetime in milliseconds
             can_be_prefix: Whether the name can be a prefix
             must_be_fresh: Whether the Data must be fresh
-            
+
         Returns:
-            Content bytes from Data packet, or None if failed
+            Content of the Data packet as a bytes-like object (often a
+            memoryview over the decoded packet buffer - no copy is made;
+            call bytes() on it only where a real bytes object is
+            required), or None if failed
         """
         try:
-            logger.info(f"Expressing Interest: {name}")
+            # %-style defers formatting until the record is emitted;
+            # f-strings would format (and stringify the name) regardless
+            # of level on every call
+            logger.info("Expressing Interest: %s", name)
             data_name, meta_info, content = await self.app.express_interest(
-                name=Name.from_str(name),
-                interest_param=InterestParam(
-                    lifetime=lifetime,
-                    can_be_prefix=can_be_prefix,
-                    must_be_fresh=must_be_fresh
-                ),
-                must_be_fresh=must_be_fresh
+                name=_formal_name(name) if isinstance(name, str) else name,
+                interest_param=_interest_param(lifetime, can_be_prefix,
+                                               must_be_fresh)
             )
             
-            logger.info(f"Received Data: {Name.to_str(data_name)}")
-            logger.debug(f"Content length: {len(content)} bytes")
-            return bytes(content)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Received Data: %s", Name.to_str(data_name))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Content length: %s bytes", len(content))
+            # Returned as-is: copying multi-KB payloads per Data packet
+            # costs one O(N) pass; downstream consumers (protobuf parse,
+            # gRPC payload assignment) accept bytes-like objects directly
+            return content
             
         except Exception as e:
-            logger.error(f"Error expressing interest: {e}", exc_info=True)
+            # No exc_info at ERROR: traceback capture (frame walking +
+            # linecache) is expensive and can amplify failure storms
+            logger.error("Error expressing interest: %s", e)
+            logger.debug("Traceback:", exc_info=True)
             return None
     
+    async def express_many(
+        self,
+        names,
+        lifetime: int = 4000,
+        concurrency: int = 64,
+        can_be_prefix: bool = False,
+        must_be_fresh: bool = False
+    ) -> list:
+        """
+        Express many Interests concurrently and collect their contents.
+
+        The round trips overlap instead of paying one RTT per name; a
+        semaphore bounds how many are outstanding at once so large
+        batches do not flood the face or the PIT.
+
+        Args:
+            names: Iterable of Interest names (URI strings or FormalNames)
+            lifetime: Interest lifetime in milliseconds
+            concurrency: Maximum Interests in flight at once
+            can_be_prefix: Whether the names can be prefixes
+            must_be_fresh: Whether the Data must be fresh
+
+        Returns:
+            List of content (bytes-like) or None per name, in input order
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(name):
+            async with sem:
+                return await self.express_interest(
+                    name, lifetime=lifetime, can_be_prefix=can_be_prefix,
+                    must_be_fresh=must_be_fresh)
+
+        # express_interest already maps NACK/timeout to None, so the
+        # gather never raises and ordering matches the input
+        return list(await asyncio.gather(*(_one(n) for n in names)))
+
     async def run(self, after_start=None):
         """
         Run the NDN client app.
@@ -99,8 +216,48 @@ class NDNClient:
         """
         await self.app.run_forever(after_start=after_start)
     
+    @classmethod
+    def shared(
+        cls,
+        pib_path: Optional[str] = None,
+        tpm_path: Optional[str] = None
+    ) -> 'NDNClient':
+        """
+        Get a client backed by a process-shared NDNApp.
+
+        Clients created this way with the same (pib_path, tpm_path)
+        reuse one NDNApp - one NFD socket and one set of asyncio
+        handlers - instead of paying per-client connection overhead.
+        shutdown() is reference counted for shared clients.
+
+        Args:
+            pib_path: Optional path to the PIB database
+            tpm_path: Optional path to the TPM directory
+
+        Returns:
+            NDNClient sharing the cached NDNApp for these paths
+        """
+        key = (pib_path, tpm_path)
+        app = _app_cache.get(key)
+        if app is None:
+            client = cls(pib_path=pib_path, tpm_path=tpm_path)
+            _app_cache[key] = client.app
+            _app_refs[key] = 1
+        else:
+            client = cls(app=app)
+            _app_refs[key] += 1
+        client._shared_key = key
+        return client
+
     def shutdown(self):
-        """Shutdown the client."""
+        """Shutdown the client (last shared user tears the app down)."""
+        key = getattr(self, '_shared_key', None)
+        if key is not None and key in _app_refs:
+            _app_refs[key] -= 1
+            if _app_refs[key] > 0:
+                return
+            del _app_cache[key]
+            del _app_refs[key]
         if self.app:
             self.app.shutdown()
 
@@ -2,15 +2,68 @@
 NDN Server for receiving Interest packets and sending Data packets.
 """
 import asyncio
+import bisect
+import json
 import logging
 import os
 from typing import Optional, Callable
 from ndn.app import NDNApp
-from ndn.encoding import Name, FormalName, InterestParam
+from ndn.encoding import Name, FormalName, InterestParam, MetaInfo, make_data
 from ndn.security import KeychainSqlite3, TpmFile
 
+from .client import _default_pib_path, _tune_pib_connection
+
+# orjson is a C implementation with no per-character Python dispatch;
+# fall back to stdlib json when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Freshness period applied to every Data packet this server emits, in
+# milliseconds. One definition keeps put_data calls and the pre-encoded
+# content store in agreement.
+_FRESHNESS_MS = 10000
+
+# Static response prefixes, UTF-8 encoded once at import; miss and error
+# paths only encode the variable part
+_NOT_FOUND_PREFIX = b'Data not found for '
+_ERR_PREFIX = b'Error: '
+
+
+def _store_key(name: FormalName) -> bytes:
+    """
+    Store key for a name: its component TLVs concatenated, without the
+    outer Name TLV header.
+
+    Dropping the header makes component-prefix relationships bytes-prefix
+    relationships (the header's length field would differ), so prefix
+    matching reduces to one bisect over the sorted keys. Component TLVs
+    are self-delimiting, so a bytes-prefix can only fall on a component
+    boundary - no false matches.
+    """
+    return b''.join(bytes(c) for c in name)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize obj to compact JSON bytes via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def bytes_handler(fn: Callable) -> Callable:
+    """
+    Mark a route handler as always returning bytes.
+
+    register_route checks the mark once at registration and skips the
+    per-Interest return-type normalization for marked handlers.
+    """
+    fn._returns_bytes = True
+    return fn
+
 
 class NDNServer:
     """NDN Server to receive Interest packets and send Data packets."""
@@ -41,17 +94,29 @@ class NDNServer:
             # Create Keychain with custom paths if provided
             if pib_path or tpm_path:
                 tpm = TpmFile(tpm_path) if tpm_path else TpmFile()
-                pib_path = pib_path or os.path.join(os.path.expanduser('~'), '.ndn', 'pib.db')
+                pib_path = pib_path or _default_pib_path()
                 keychain = KeychainSqlite3(pib_path, tpm)
+                _tune_pib_connection(keychain)
                 self.app = NDNApp(keychain=keychain)
-                logger.info(f"Using custom PIB path: {pib_path}")
+                logger.info("Using custom PIB path: %s", pib_path)
                 if tpm_path:
-                    logger.info(f"Using custom TPM path: {tpm_path}")
+                    logger.info("Using custom TPM path: %s", tpm_path)
             else:
                 self.app = NDNApp()
                 logger.debug("Using default PIB and TPM paths")
         
-        self.data_store: dict[str, bytes] = {}
+        # Both stores are keyed by _store_key(name): one concatenation of
+        # already-encoded component TLVs per packet, where a string key
+        # would force a Name.to_str re-walk plus string hash
+        self.data_store: dict[bytes, bytes] = {}
+        # Content Store: store key -> fully encoded, signed Data packet
+        # bytes, so repeated Interests skip TLV encoding and signing
+        self._cs: dict[bytes, bytes] = {}
+        # Sorted store keys plus key -> FormalName, for serving Interests
+        # with can_be_prefix: the headerless keys sort so that any name
+        # under a prefix lands right after the prefix itself
+        self._sorted_keys: list[bytes] = []
+        self._names: dict[bytes, FormalName] = {}
     
     def register_route(self, prefix: str, handler: Optional[Callable] = None):
         """
@@ -64,40 +129,99 @@ class NDNServer:
         """
         def default_handler(name: FormalName, param: InterestParam, app_param: bytes):
             """Default handler that looks up data in data_store."""
-            name_str = Name.to_str(name)
-            logger.info(f"Received Interest: {name_str}")
-            
-            if name_str in self.data_store:
-                content = self.data_store[name_str]
-            else:
+            # Key on the component TLVs - no string round trip per packet.
+            # Name.to_str only runs inside enabled-log branches, so under
+            # production levels the handler never stringifies the name.
+            key = _store_key(name)
+            info_on = logger.isEnabledFor(logging.INFO)
+            if info_on:
+                logger.info("Received Interest: %s", Name.to_str(name))
+
+            data_name = name
+            content = None
+            packet = self._cs.get(key)
+            if packet is None:
+                content = self.data_store.get(key)
+                if content is None and param.can_be_prefix:
+                    # NDN prefix match: any stored name under the Interest
+                    # name satisfies it. Sorted headerless keys put such
+                    # names immediately after the prefix, so one bisect
+                    # plus a startswith finds a match in O(log n).
+                    i = bisect.bisect_left(self._sorted_keys, key)
+                    if (i < len(self._sorted_keys)
+                            and self._sorted_keys[i].startswith(key)):
+                        match = self._sorted_keys[i]
+                        packet = self._cs.get(match)
+                        if packet is None:
+                            content = self.data_store[match]
+                            data_name = self._names[match]
+
+            # Serve the pre-encoded packet when available - one dict
+            # lookup, no per-Interest encoding or signing
+            if packet is not None:
+                if info_on:
+                    logger.info("Sending cached Data: %s", Name.to_str(name))
+                self.app.put_raw_packet(packet)
+                return
+
+            if content is None:
                 # Return a default message if not found
-                content = f"Data not found for {name_str}".encode()
-                logger.warning(f"Data not found for {name_str}")
-            
-            # Send Data packet
-            logger.info(f"Sending Data: {name_str}, Content length: {len(content)} bytes")
-            self.app.put_data(name, content=content, freshness_period=10000)
+                name_str = Name.to_str(name)
+                content = _NOT_FOUND_PREFIX + name_str.encode()
+                logger.warning("Data not found for %s", name_str)
+
+            # Send Data packet under the stored (full) name, which on a
+            # prefix match differs from the Interest name
+            if info_on:
+                logger.info("Sending Data: %s, Content length: %s bytes",
+                            Name.to_str(data_name), len(content))
+            self.app.put_data(data_name, content=content,
+                              freshness_period=_FRESHNESS_MS)
         
         if handler:
+            # Determined once at registration, not per packet
+            handler_is_async = asyncio.iscoroutinefunction(handler)
+            returns_bytes = getattr(handler, '_returns_bytes', False)
+
+            async def _respond(name: FormalName, param: InterestParam,
+                               app_param: bytes):
+                """Run the user handler and answer the Interest."""
+                try:
+                    if handler_is_async:
+                        content = await handler(name, param, app_param)
+                    else:
+                        # Sync handlers run off-thread: CPU work (signing,
+                        # compression, serialization) would otherwise
+                        # stall every other Interest on the same face
+                        content = await asyncio.get_running_loop() \
+                            .run_in_executor(None, handler, name, param,
+                                             app_param)
+                    if not returns_bytes and not isinstance(content, bytes):
+                        # Structured returns get real JSON; str() on a
+                        # dict would produce repr, not JSON
+                        if isinstance(content, (dict, list)):
+                            content = _json_dumps(content)
+                        else:
+                            content = str(content).encode()
+                except Exception as e:
+                    logger.error("Handler error: %s", e, exc_info=True)
+                    content = _ERR_PREFIX + str(e).encode()
+
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Sending Data: %s, Content length: %s bytes",
+                                Name.to_str(name), len(content))
+                self.app.put_data(name, content=content, freshness_period=_FRESHNESS_MS)
+
             @self.app.route(prefix)
             def interest_handler(name: FormalName, param: InterestParam, app_param: bytes):
                 """Handle incoming Interest with custom handler."""
-                name_str = Name.to_str(name)
-                logger.info(f"Received Interest: {name_str}")
-                try:
-                    content = handler(name, param, app_param)
-                    if not isinstance(content, bytes):
-                        content = str(content).encode()
-                except Exception as e:
-                    logger.error(f"Handler error: {e}", exc_info=True)
-                    content = f"Error: {e}".encode()
-                
-                logger.info(f"Sending Data: {name_str}, Content length: {len(content)} bytes")
-                self.app.put_data(name, content=content, freshness_period=10000)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Received Interest: %s", Name.to_str(name))
+                asyncio.ensure_future(_respond(name, param, app_param))
         else:
             self.app.route(prefix)(default_handler)
         
-        logger.info(f"Registered route: {prefix}")
+        logger.info("Registered route: %s", prefix)
     
     def store_data(self, name: str, content: bytes):
         """
@@ -107,11 +231,49 @@ class NDNServer:
             name: Name to store data under
             content: Content bytes to store
         """
-        self.data_store[name] = content
-        logger.info(f"Stored data for: {name}")
+        formal = Name.from_str(name)
+        key = _store_key(formal)
+        if key not in self.data_store:
+            bisect.insort(self._sorted_keys, key)
+            self._names[key] = formal
+        self.data_store[key] = content
+        try:
+            # Encode and sign the Data packet once at store time; serving
+            # then reduces to put_raw_packet of the cached bytes
+            signer = self.app.keychain.get_signer({})
+            self._cs[key] = bytes(make_data(
+                formal,
+                MetaInfo(freshness_period=_FRESHNESS_MS),
+                content,
+                signer=signer
+            ))
+        except Exception as e:
+            # Without a usable keychain, fall back to per-Interest encoding
+            logger.debug("Could not pre-encode Data for %s: %s", name, e)
+        logger.info("Stored data for: %s", name)
     
+    def store_json(self, name: str, obj) -> None:
+        """
+        Store JSON-serializable content for a given name.
+
+        Serializes once at store time with orjson when available (a
+        C-level encoder), so servers pushing many small structured Data
+        packets skip the Python-level JSON loop.
+
+        Args:
+            name: Name to store data under
+            obj: JSON-serializable object
+        """
+        self.store_data(name, _json_dumps(obj))
+
     async def run(self):
         """Run the NDN server app."""
+        try:
+            # Load and cache signing key material now, so the first
+            # signed Data packet doesn't pay the keychain lookup
+            self.app.keychain.get_signer({})
+        except Exception as e:
+            logger.debug("Keychain pre-warm skipped: %s", e)
         logger.info("Starting NDN server...")
         await self.app.run_forever()
     
@@ -4,6 +4,12 @@ Test module for NDN/gRPC conversion functionality.
 
 import pytest
 from python_project.utils import setup_logging
+from python_project.grpc import bidirectional_pb2
+from python_project.grpc.converter import (
+    data_content_to_grpc_data,
+    grpc_data_to_data_content,
+    interest_name_to_grpc_request,
+)
 
 
 class TestUtils:
@@ -16,3 +22,33 @@ class TestUtils:
         setup_logging("DEBUG")
         setup_logging("WARNING")
         setup_logging("ERROR")
+
+
+class TestConverter:
+    """Test cases for gRPC Data content conversion."""
+
+    def test_data_content_roundtrip(self):
+        """Data message survives a protobuf content round-trip."""
+        data = bidirectional_pb2.Data(value=42, payload=b"\x00hello")
+        content = grpc_data_to_data_content(data)
+        assert data_content_to_grpc_data(content) == data
+
+    def test_data_content_roundtrip_legacy_json(self):
+        """Data message survives a legacy JSON content round-trip."""
+        data = bidirectional_pb2.Data(value=42, payload=b"\x00hello")
+        content = grpc_data_to_data_content(data, legacy_json=True)
+        assert data_content_to_grpc_data(content, legacy_json=True) == data
+
+    def test_interest_name_to_grpc_request(self):
+        """Interest names map to Data requests, with a fallback."""
+        request = interest_name_to_grpc_request("/grpc/process/7/hello")
+        assert request.value == 7
+        assert request.payload == b"hello"
+
+        request = interest_name_to_grpc_request("/grpc/process/7")
+        assert request.value == 7
+        assert request.payload == b"from_ndn_7"
+
+        request = interest_name_to_grpc_request("/other/name")
+        assert request.value == 0
+        assert request.payload == b"/other/name"